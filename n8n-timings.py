@@ -7,20 +7,47 @@ and creates an interactive plot viewer with proper navigation.
 """
 
 import os
-import json
+import sys
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import argparse
 from dotenv import load_dotenv
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; responses are parsed whole with orjson instead
+    ijson = None
 
 # Load environment variables
 load_dotenv()
 
+# Per-run fields of runData that the analysis reads (see parse_execution_stream)
+RUN_DATA_PATH = ['data', 'resultData', 'runData']
+RUN_DATA_FIELDS = {'startTime', 'executionTime', 'executionStatus', 'executionIndex'}
+
+# Execution and workflow node fields kept in the on-disk cache (see save_execution_cache)
+CACHED_EXECUTION_FIELDS = ['id', 'workflowId', 'status', 'startedAt', 'stoppedAt', 'createdAt']
+CACHED_NODE_FIELDS = ['id', 'name', 'type', 'position']
+
+# Record layout for one parsed node execution (see parse_run_data)
+NODE_EXECUTION_DTYPE = np.dtype([
+    ('node_id', np.int32),
+    ('start_ms', np.float64),
+    ('dur_ms', np.float32),
+    ('status', np.uint8),
+    ('exec_idx', np.int32)
+])
+
 class InteractivePlotViewer:
     """Interactive plot viewer with navigation."""
     
@@ -51,19 +78,33 @@ class InteractivePlotViewer:
             'hierarchical_timeline': 'timeline'
         }
         
-        # Prepare data
-        self.node_names = list(node_summary.keys())
+        # Prepare data, ordered once by total time (slowest nodes first) for all bar charts
+        order = np.argsort([-stats['total_time'] for stats in node_summary.values()], kind='stable')
+        stats_list = list(node_summary.values())
+        node_names = list(node_summary.keys())
+        self.node_names = [node_names[i] for i in order]
         self.data = {
-            'total_time': [stats['total_time'] for stats in node_summary.values()],
-            'avg_time': [stats['average_time'] for stats in node_summary.values()],
-            'execution_count': [stats['total_executions'] for stats in node_summary.values()],
-            'success_rate': [stats['success_rate'] for stats in node_summary.values()],
+            'total_time': [stats_list[i]['total_time'] for i in order],
+            'avg_time': [stats_list[i]['average_time'] for i in order],
+            'execution_count': [stats_list[i]['total_executions'] for i in order],
+            'success_rate': [stats_list[i]['success_rate'] for i in order],
             'hierarchical_timeline': []  # Special case - will be handled separately
         }
+        self._x = np.arange(len(self.node_names))
+        
+        # Bar labels never change for a viewer, so format them once
+        self._labels = {pt: [self._fmt(v, self.plot_units[pt]) for v in vals] for pt, vals in self.data.items()}
         
         # Extract workflow structure for hierarchical view
         self.workflow_structure = self.extract_workflow_structure()
         
+        # Interactive figure state: one pre-rendered axes and layout per plot type
+        self.fig = None
+        self._axes = {}
+        self._layouts = {}
+        self._backgrounds = {}
+        self._timeline_cache = None
+        
         # Calculate optimal figure size
         num_nodes = len(self.node_names)
         if num_nodes <= 5:
@@ -79,6 +120,40 @@ class InteractivePlotViewer:
             self.fig_width = 18
             self.fig_height = 14
     
+    @staticmethod
+    def _fmt(value: float, unit: str) -> str:
+        """Format a bar value label for the given unit."""
+        if unit == '%':
+            return f'{value:.1f}%'
+        elif unit == 'seconds':
+            return f'{value:.2f}s'
+        return f'{value}'
+    
+    @staticmethod
+    def _merge_subpixel_spans(spans: np.ndarray, min_width: float) -> np.ndarray:
+        """Merge runs of adjacent (x, width) spans narrower than min_width into single spans."""
+        if len(spans) < 2 or min_width <= 0:
+            return spans
+        starts = spans[:, 0]
+        ends = starts + spans[:, 1]
+        narrow = spans[:, 1] < min_width
+        
+        # A span starts a new bar unless it and its predecessor are both too narrow
+        # to see and the gap between them is under a pixel as well
+        joins = narrow[1:] & narrow[:-1] & (starts[1:] - np.maximum.accumulate(ends)[:-1] < min_width)
+        first = np.flatnonzero(np.concatenate(([True], ~joins)))
+        merged_starts = starts[first]
+        return np.column_stack((merged_starts, np.maximum.reduceat(ends, first) - merged_starts))
+    
+    @staticmethod
+    def _span_vertices(spans: np.ndarray, y0: float, y1: float) -> np.ndarray:
+        """Rectangle vertices for (x, width) spans, laid out like broken_barh's."""
+        x0 = spans[:, 0]
+        x1 = x0 + spans[:, 1]
+        xs = np.column_stack((x0, x0, x1, x1))
+        ys = np.broadcast_to([y0, y1, y1, y0], xs.shape)
+        return np.stack((xs, ys), axis=-1)
+    
     def extract_workflow_structure(self) -> Dict[str, Any]:
         """Extract workflow structure from execution data."""
         workflow_data = self.execution_info.get('workflow_data', {})
@@ -86,21 +161,20 @@ class InteractivePlotViewer:
         connections = workflow_data.get('connections', {})
         
         # Build node structure
-        node_structure = {}
-        for node in nodes:
-            node_structure[node['id']] = {
+        node_structure = {
+            node['id']: {
                 'name': node.get('name', node['id']),
                 'type': node.get('type', 'unknown'),
                 'position': node.get('position', {'x': 0, 'y': 0}),
                 'connections': []
             }
+            for node in nodes
+        }
         
-        # Build connections
-        for source_id, targets in connections.items():
-            if source_id in node_structure:
-                for target_id in targets:
-                    if target_id in node_structure:
-                        node_structure[source_id]['connections'].append(target_id)
+        # Build connections, skipping references to nodes that no longer exist
+        for source_id in connections.keys() & node_structure.keys():
+            node_structure[source_id]['connections'] = [target_id for target_id in connections[source_id]
+                                                        if target_id in node_structure]
         
         return node_structure
     
@@ -108,59 +182,90 @@ class InteractivePlotViewer:
         """Create the current plot."""
         plt.clf()  # Clear the current figure
         
-        plot_type = self.plots[self.current_plot]
+        self.render_plot(self.plots[self.current_plot], plt.subplot(111))
         
+        plt.tight_layout()
+    
+    def render_plot(self, plot_type: str, ax):
+        """Draw the given plot type into an axes."""
         if plot_type == 'hierarchical_timeline':
-            self.create_hierarchical_timeline()
+            self.create_hierarchical_timeline(ax)
         else:
-            self.create_bar_chart(plot_type)
-        
-        plt.tight_layout()
+            self.create_bar_chart(plot_type, ax)
+    
+    def build_cached_axes(self):
+        """Pre-render every plot into its own axes and remember its tight layout."""
+        for plot_type in self.plots:
+            ax = self.fig.add_subplot(111)
+            self.render_plot(plot_type, ax)
+            self._axes[plot_type] = ax
+        
+        for plot_type, ax in self._axes.items():
+            for other in self._axes.values():
+                other.set_visible(other is ax)
+            self.fig.tight_layout()
+            params = self.fig.subplotpars
+            self._layouts[plot_type] = dict(left=params.left, right=params.right,
+                                            bottom=params.bottom, top=params.top)
+        
+        self.switch_plot()
+    
+    def switch_plot(self):
+        """Show the cached axes of the current plot and hide the others."""
+        plot_type = self.plots[self.current_plot]
+        for other_type, ax in self._axes.items():
+            ax.set_visible(other_type == plot_type)
+        self.fig.subplots_adjust(**self._layouts[plot_type])
+        
+        # Blit the saved raster of this plot if we have one, otherwise do a full draw
+        canvas = self.fig.canvas
+        background = self._backgrounds.get(plot_type)
+        if background is not None:
+            canvas.restore_region(background)
+            canvas.blit(self.fig.bbox)
+        else:
+            canvas.draw_idle()
     
-    def create_bar_chart(self, plot_type: str):
+    def on_draw(self, event):
+        """Save the freshly drawn raster of the current plot for blitting."""
+        if self.fig.canvas.supports_blit:
+            self._backgrounds[self.plots[self.current_plot]] = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+    
+    def on_resize(self, event):
+        """Drop saved rasters; they no longer match the canvas size."""
+        self._backgrounds.clear()
+    
+    def create_bar_chart(self, plot_type: str, ax):
         """Create a bar chart for the given plot type."""
         plot_data = self.data[plot_type]
         
         # Create the main plot
-        ax = plt.subplot(111)
-        bars = ax.bar(range(len(self.node_names)), plot_data, 
+        bars = ax.bar(self._x, plot_data, 
                      color=self.plot_colors[plot_type], alpha=0.8)
         
         # Set title and labels
-        ax.set_title(f'{self.plot_titles[plot_type]} (Plot {self.current_plot + 1}/{len(self.plots)})', 
+        ax.set_title(f'{self.plot_titles[plot_type]} (Plot {self.plots.index(plot_type) + 1}/{len(self.plots)})', 
                     fontsize=16, fontweight='bold')
         ax.set_xlabel('Nodes', fontsize=12)
         ax.set_ylabel(f'{self.plot_titles[plot_type].split(" by ")[0]} ({self.plot_units[plot_type]})', fontsize=12)
         
         # Set x-axis labels
-        ax.set_xticks(range(len(self.node_names)))
+        ax.set_xticks(self._x)
         ax.set_xticklabels(self.node_names, rotation=45, ha='right')
         ax.grid(True, alpha=0.3)
         
         # Add value labels on bars
-        max_val = max(plot_data) if plot_data else 1
-        for i, (bar, value) in enumerate(zip(bars, plot_data)):
-            if self.plot_units[plot_type] == '%':
-                label = f'{value:.1f}%'
-            elif self.plot_units[plot_type] == 'seconds':
-                label = f'{value:.2f}s'
-            else:
-                label = f'{value}'
-            
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max_val*0.01, 
-                   label, ha='center', va='bottom', fontsize=10)
+        ax.bar_label(bars, labels=self._labels[plot_type], padding=3, fontsize=10)
         
         # Add execution info
         info_text = f"Execution {self.execution_info['execution_id']} | {self.execution_info['workflow_name']} | {self.execution_info['total_nodes']} nodes"
         ax.text(0.02, 0.98, info_text, transform=ax.transAxes, fontsize=10, 
                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
-    def create_hierarchical_timeline(self):
+    def create_hierarchical_timeline(self, ax):
         """Create hierarchical timeline visualization."""
-        ax = plt.subplot(111)
-        
         # Set up the plot
-        ax.set_title(f'{self.plot_titles["hierarchical_timeline"]} (Plot {self.current_plot + 1}/{len(self.plots)})', 
+        ax.set_title(f'{self.plot_titles["hierarchical_timeline"]} (Plot {self.plots.index("hierarchical_timeline") + 1}/{len(self.plots)})', 
                     fontsize=16, fontweight='bold')
         ax.set_xlabel('Time', fontsize=12)
         ax.set_ylabel('Node Hierarchy', fontsize=12)
@@ -173,70 +278,74 @@ class InteractivePlotViewer:
                    transform=ax.transAxes, fontsize=14)
             return
         
-        # Plot timeline bars
+        # Plot timeline bars; start times are converted to seconds from the execution
+        # start with datetime64 arithmetic (both sides are UTC already, so no tz handling)
+        exec_start_time = self.execution_info.get('start_time')
+        base = pd.Timestamp(exec_start_time).to_datetime64() if exec_start_time else None
+        relative_starts_by_node = {
+            node_name: ((executions['start_time'].to_numpy(dtype='datetime64[ms]') - base) / np.timedelta64(1, 's')
+                        if base is not None else np.zeros(len(executions)))
+            for node_name, executions in timeline_data.items()
+        }
+        latest_start = max((starts.max() for starts in relative_starts_by_node.values() if len(starts)), default=None)
+        
+        # Width of one horizontal pixel in seconds; narrower runs get merged with their neighbours
+        axes_width_px = ax.get_window_extent().width
+        min_width = ((latest_start or 0.0) + 1) / axes_width_px if axes_width_px > 0 else 0.0
+        bar_spans = []  # (collection, unmerged spans, y range) so zooming can re-merge
+        
         y_positions = {}
+        labels = []
         y_pos = 0
         
         for node_name, executions in timeline_data.items():
             y_positions[node_name] = y_pos
+            relative_starts = relative_starts_by_node[node_name]
             
-            for execution in executions:
-                start_time = execution['start_time']
-                duration = execution['duration']
-                status = execution['status']
-                
-                # Convert to relative time (seconds from start)
-                if start_time and self.execution_info.get('start_time'):
-                    # Handle timezone mismatch - make both datetimes timezone-aware
-                    exec_start_time = self.execution_info['start_time']
-                    if start_time.tzinfo is None and exec_start_time.tzinfo is not None:
-                        # Make start_time timezone-aware by assuming UTC
-                        start_time = start_time.replace(tzinfo=exec_start_time.tzinfo)
-                    elif start_time.tzinfo is not None and exec_start_time.tzinfo is None:
-                        # Make exec_start_time timezone-aware by assuming UTC
-                        exec_start_time = exec_start_time.replace(tzinfo=start_time.tzinfo)
-                    
-                    relative_start = (start_time - exec_start_time).total_seconds()
-                else:
-                    relative_start = 0
-                
-                # Color based on status
-                color = 'green' if status == 'success' else 'red' if status == 'error' else 'orange'
-                
-                # Draw execution bar
-                bar = patches.Rectangle((relative_start, y_pos - 0.4), duration, 0.8, 
-                                      facecolor=color, alpha=0.7, edgecolor='black', linewidth=0.5)
-                ax.add_patch(bar)
-                
-                # Add duration label
-                if duration > 0.1:  # Only show label for longer executions
-                    ax.text(relative_start + duration/2, y_pos, f'{duration:.2f}s', 
-                           ha='center', va='center', fontsize=8, fontweight='bold')
+            # Map statuses to bar colors for the whole node at once
+            durations = executions['duration'].to_numpy(dtype=np.float64)
+            statuses = executions['status'].to_numpy()
+            colors = np.where(statuses == 'success', 'green', np.where(statuses == 'error', 'red', 'orange'))
+            spans = np.column_stack((relative_starts, durations))
+            
+            # One collection artist per node and color instead of one Rectangle per execution
+            for color in ('green', 'red', 'orange'):
+                mask = colors == color
+                if mask.any():
+                    collection = ax.broken_barh(self._merge_subpixel_spans(spans[mask], min_width),
+                                                (y_pos - 0.4, 0.8), facecolors=color, alpha=0.7,
+                                                edgecolors='black', linewidth=0.5)
+                    bar_spans.append((collection, spans[mask], (y_pos - 0.4, y_pos + 0.4)))
+            
+            # Collect duration labels for longer executions
+            long_runs = durations > 0.1
+            labels.extend((x, y_pos, f'{duration:.2f}s') for x, duration in
+                          zip((relative_starts + durations/2)[long_runs].tolist(), durations[long_runs].tolist()))
             
             y_pos += 1
         
+        # Add duration labels
+        for x, y, text in labels:
+            ax.text(x, y, text, ha='center', va='center', fontsize=8, fontweight='bold')
+        
         # Set y-axis labels
         ax.set_yticks(range(len(timeline_data)))
         ax.set_yticklabels(list(timeline_data.keys()))
         
         # Set x-axis limits
-        all_start_times = []
-        for execs in timeline_data.values():
-            for exec in execs:
-                if exec['start_time']:
-                    all_start_times.append(exec['start_time'])
-        
-        if all_start_times and self.execution_info.get('start_time'):
-            max_time = max(all_start_times)
-            # Handle timezone mismatch for x-axis limits
-            exec_start_time = self.execution_info['start_time']
-            if max_time.tzinfo is None and exec_start_time.tzinfo is not None:
-                max_time = max_time.replace(tzinfo=exec_start_time.tzinfo)
-            elif max_time.tzinfo is not None and exec_start_time.tzinfo is None:
-                exec_start_time = exec_start_time.replace(tzinfo=max_time.tzinfo)
-            
-            max_relative_time = (max_time - exec_start_time).total_seconds()
-            ax.set_xlim(0, max_relative_time + 1)
+        if base is not None and latest_start is not None:
+            ax.set_xlim(0, latest_start + 1)
+        
+        # Merged bars are only valid at the zoom they were computed for, so redo the
+        # merge from the raw spans whenever the visible time range changes
+        def remerge_spans(ax):
+            x_min, x_max = ax.get_xlim()
+            width_px = ax.get_window_extent().width
+            min_width = (x_max - x_min) / width_px if width_px > 0 else 0.0
+            for collection, spans, (y0, y1) in bar_spans:
+                collection.set_verts(self._span_vertices(self._merge_subpixel_spans(spans, min_width), y0, y1))
+        
+        ax.callbacks.connect('xlim_changed', remerge_spans)
         
         ax.grid(True, alpha=0.3)
         
@@ -253,37 +362,33 @@ class InteractivePlotViewer:
         ax.text(0.02, 0.98, info_text, transform=ax.transAxes, fontsize=10, 
                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
-    def build_execution_timeline(self) -> Dict[str, List[Dict]]:
-        """Build timeline data from node executions."""
-        timeline_data = {}
-        
-        for node_name, stats in self.node_summary.items():
-            executions = []
-            for execution in stats['executions']:
-                if execution['start_time'] and execution['duration']:
-                    executions.append({
-                        'start_time': execution['start_time'],
-                        'duration': execution['duration'],
-                        'status': execution['status']
-                    })
-            
-            # Sort by start time
-            executions.sort(key=lambda x: x['start_time'])
-            timeline_data[node_name] = executions
-        
-        return timeline_data
+    def build_execution_timeline(self) -> Dict[str, pd.DataFrame]:
+        """Build timeline data (per-node frames sorted by start time) from node executions."""
+        # Execution data never changes for a viewer, so group it only once
+        if self._timeline_cache is not None:
+            return self._timeline_cache
+        
+        node_executions = self.execution_info['node_executions']
+        
+        # Only executions with a start time and a non-zero duration are drawn
+        drawn = node_executions[node_executions['start_time'].notna() & (node_executions['duration'].fillna(0) != 0)]
+        drawn = drawn.sort_values('start_time', kind='stable')
+        groups = dict(iter(drawn.groupby('node_name', sort=False, observed=True)))
+        
+        # Keep every node (in execution order) so nodes without drawable runs still get a row
+        self._timeline_cache = {node_name: groups.get(node_name, drawn.iloc[:0])
+                                for node_name in node_executions['node_name'].unique()}
+        return self._timeline_cache
     
     def prev_plot(self, event):
         """Go to previous plot."""
         self.current_plot = (self.current_plot - 1) % len(self.plots)
-        self.create_plot()
-        plt.draw()
+        self.switch_plot()
     
     def next_plot(self, event):
         """Go to next plot."""
         self.current_plot = (self.current_plot + 1) % len(self.plots)
-        self.create_plot()
-        plt.draw()
+        self.switch_plot()
     
     def on_key(self, event):
         """Handle keyboard events."""
@@ -297,11 +402,15 @@ class InteractivePlotViewer:
     def show(self):
         """Show the interactive plot."""
         # Set up the figure
-        fig = plt.figure(figsize=(self.fig_width, self.fig_height))
-        fig.canvas.mpl_connect('key_press_event', self.on_key)
+        # Large workflows already get a big figure; a lower DPI keeps redraws cheap
+        dpi = 80 if len(self.node_names) > 20 else None
+        self.fig = plt.figure(figsize=(self.fig_width, self.fig_height), dpi=dpi)
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+        self.fig.canvas.mpl_connect('resize_event', self.on_resize)
         
-        # Create initial plot
-        self.create_plot()
+        # Render all plots once; navigation only toggles visibility
+        self.build_cached_axes()
         
         # Show the plot
         plt.show()
@@ -393,7 +502,7 @@ class InteractivePlotViewer:
 class N8nLoopedNodeAnalyzer:
     """Analyzes n8n workflow execution data with looped nodes."""
     
-    def __init__(self, base_url: str, api_key: str, debug: bool = False):
+    def __init__(self, base_url: str, api_key: str, debug: bool = False, stream_json: bool = False):
         """
         Initialize the analyzer with API credentials.
         
@@ -401,16 +510,29 @@ class N8nLoopedNodeAnalyzer:
             base_url: Base URL of the n8n instance
             api_key: API key for authentication
             debug: Enable debug mode for detailed output
+            stream_json: Stream-parse responses with ijson (slower, but far less memory for huge executions)
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.debug = debug
+        self.stream_json = stream_json
         self.session = requests.Session()
         
-        # Correct n8n API authentication
+        # Keep-alive connection pool sized for concurrent fetches, with retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Correct n8n API authentication; execution JSON compresses well, so ask for gzip
         self.session.headers.update({
             'X-N8N-API-KEY': api_key,
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json'
         })
     
@@ -420,7 +542,7 @@ class N8nLoopedNodeAnalyzer:
             print(f"🔍 DEBUG: {message}")
             if data is not None:
                 if isinstance(data, (dict, list)):
-                    print(json.dumps(data, indent=2, default=str))
+                    print(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode())
                 else:
                     print(f"Data: {data}")
             print("-" * 50)
@@ -438,31 +560,97 @@ class N8nLoopedNodeAnalyzer:
         # Use includeData=true to get detailed execution data
         url = f"{self.base_url}/api/v1/executions/{execution_id}?includeData=true"
         
+        # Stream the body through ijson only when asked to; debug mode needs the raw payload
+        stream = self.stream_json and ijson is not None and not self.debug
+        
         try:
-            response = self.session.get(url)
-            self.debug_print(f"API Response Status: {response.status_code}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.debug_print("Raw API Response", data)
-                return data
-            elif response.status_code == 404:
-                print(f"Execution {execution_id} not found")
-                return None
-            else:
-                print(f"API Error: {response.text}")
-                return None
+            with self.session.get(url, stream=stream) as response:
+                if self.debug:
+                    self.debug_print(f"API Response Status: {response.status_code}")
+                
+                if response.status_code == 200:
+                    if stream:
+                        response.raw.decode_content = True
+                        try:
+                            return self.parse_execution_stream(response.raw)
+                        except (ijson.JSONError, urllib3.exceptions.HTTPError) as e:
+                            print(f"Stream Error: {e}")
+                            return None
+                    # orjson parses the (often multi-MB) payload much faster than stdlib json
+                    data = orjson.loads(response.content)
+                    if self.debug:
+                        self.debug_print("Raw API Response", data)
+                    return data
+                elif response.status_code == 404:
+                    print(f"Execution {execution_id} not found")
+                    return None
+                else:
+                    print(f"API Error: {response.text}")
+                    return None
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Request Error: {e}")
             return None
     
-    def analyze_looped_execution(self, execution_data: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_execution_stream(self, stream) -> Dict[str, Any]:
+        """
+        Incrementally parse an execution response without materializing node outputs.
+        
+        Everything outside the data field is kept as is. Inside it only
+        data.resultData.runData is kept, and for each run only RUN_DATA_FIELDS,
+        so the (usually dominant) output items are dropped while parsing.
+        
+        Args:
+            stream: File-like object with the JSON response body
+            
+        Returns:
+            Execution data dictionary in the shape parse_run_data expects
+        """
+        builder = ijson.ObjectBuilder()
+        path = []  # key (or 'item' for arrays) of every container we are inside
+        
+        for _, event, value in ijson.parse(stream, use_float=True):
+            if event == 'map_key':
+                path[-1] = value
+            elif event in ('end_map', 'end_array'):
+                path.pop()
+            
+            # Path is data.resultData.runData.<node>.item.<field>...
+            keep = (not path or path[0] != 'data'
+                    or (path[:3] == RUN_DATA_PATH[:len(path)]
+                        and (len(path) <= 5 or path[5] in RUN_DATA_FIELDS)))
+            if keep:
+                builder.event(event, value)
+            
+            if event == 'start_map':
+                path.append(None)
+            elif event == 'start_array':
+                path.append('item')
+        
+        return builder.value
+    
+    def fetch_many_executions(self, execution_ids: List[int], max_workers: int = 8) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Fetch several executions concurrently over the shared session.
+        
+        Args:
+            execution_ids: The execution IDs to fetch
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary mapping each execution ID to its data (None if failed)
+        """
+        execution_ids = list(dict.fromkeys(execution_ids))  # request each execution only once
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(execution_ids)))) as pool:
+            return dict(zip(execution_ids, pool.map(self.fetch_execution_data, execution_ids)))
+    
+    def analyze_looped_execution(self, execution_data: Dict[str, Any], cache_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze a single execution with looped nodes and sum up execution times.
         
         Args:
             execution_data: Execution data dictionary
+            cache_dir: If given, store the parsed execution there for later runs
             
         Returns:
             Dictionary containing looped node analysis
@@ -470,91 +658,138 @@ class N8nLoopedNodeAnalyzer:
         if not execution_data:
             return {}
         
-        # Extract basic execution info
-        execution_id = execution_data.get('id')
-        workflow_id = execution_data.get('workflowId')
-        workflow_name = execution_data.get('workflowData', {}).get('name', 'Unknown')
-        workflow_data = execution_data.get('workflowData', {})
-        status = execution_data.get('status', 'unknown')
-        started_at = execution_data.get('startedAt')
-        stopped_at = execution_data.get('stoppedAt')
-        created_at = execution_data.get('createdAt')
-        
-        # Parse timestamps
-        start_time = None
-        end_time = None
-        duration = None
-        
-        if started_at:
-            start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+        rows, node_names, status_names = self.parse_run_data(execution_data)
+        if cache_dir:
+            self.save_execution_cache(execution_data, rows, node_names, status_names, cache_dir)
         
-        if stopped_at:
-            end_time = datetime.fromisoformat(stopped_at.replace('Z', '+00:00'))
-            if start_time:
-                duration = (end_time - start_time).total_seconds()
+        return self.summarize_execution(execution_data, rows, node_names, status_names)
+    
+    def parse_run_data(self, execution_data: Dict[str, Any]) -> Tuple[np.ndarray, List[str], List[str]]:
+        """
+        Parse the runData of an execution into a structure-of-arrays record buffer.
         
-        # Analyze looped node executions
-        node_executions = []
-        node_summary = defaultdict(list)  # Group by node name
+        Args:
+            execution_data: Execution data dictionary
+            
+        Returns:
+            Tuple of (NODE_EXECUTION_DTYPE records, node names, status names); the
+            records store node names and statuses as indices into those lists
+        """
+        node_names = []
+        status_codes = {}
+        rows = np.empty(0, dtype=NODE_EXECUTION_DTYPE)
         
         if 'data' in execution_data and execution_data['data']:
             data_field = execution_data['data']
-            self.debug_print("Processing data field", data_field)
+            if self.debug:
+                self.debug_print("Processing data field", data_field)
             
             if 'resultData' in data_field and 'runData' in data_field['resultData']:
                 run_data = data_field['resultData']['runData']
-                self.debug_print("Found runData", run_data)
+                if self.debug:
+                    self.debug_print("Found runData", run_data)
+                node_names = list(run_data)
                 
-                for node_name, node_executions_list in run_data.items():
-                    self.debug_print(f"Processing node: {node_name}", node_executions_list)
-                    
-                    for execution in node_executions_list:
-                        # Convert timestamp from milliseconds to datetime
-                        start_timestamp = execution.get('startTime')
-                        execution_time = execution.get('executionTime', 0)
-                        execution_status = execution.get('executionStatus', 'unknown')
-                        
-                        node_start_time = None
-                        node_duration = None
-                        
-                        if start_timestamp:
-                            # Convert from milliseconds to datetime (UTC)
-                            node_start_time = datetime.fromtimestamp(start_timestamp / 1000, tz=timezone.utc)
-                            node_duration = execution_time / 1000.0  # Convert to seconds
-                        
-                        node_execution = {
-                            'execution_id': execution_id,
-                            'workflow_name': workflow_name,
-                            'node_name': node_name,
-                            'start_time': node_start_time,
-                            'duration': node_duration,
-                            'status': execution_status,
-                            'execution_index': execution.get('executionIndex', 0)
-                        }
+                def iter_rows():
+                    for node_id, (node_name, node_executions_list) in enumerate(run_data.items()):
+                        if self.debug:
+                            self.debug_print(f"Processing node: {node_name}", node_executions_list)
                         
-                        self.debug_print(f"Node execution: {node_name}", node_execution)
-                        node_executions.append(node_execution)
-                        
-                        # Group by node name for summary
-                        node_summary[node_name].append(node_execution)
+                        for execution in node_executions_list:
+                            status_name = execution.get('executionStatus') or 'unknown'
+                            # Raw epoch milliseconds (NaN if missing); converted in bulk later
+                            yield (node_id,
+                                   execution.get('startTime') or np.nan,
+                                   execution.get('executionTime', 0),
+                                   status_codes.setdefault(status_name, len(status_codes)),
+                                   execution.get('executionIndex', 0))
+                
+                nrows = sum(len(node_executions_list) for node_executions_list in run_data.values())
+                rows = np.fromiter(iter_rows(), dtype=NODE_EXECUTION_DTYPE, count=nrows)
+        
+        return rows, node_names, list(status_codes)
+    
+    def summarize_execution(self, execution_data: Dict[str, Any], rows: np.ndarray,
+                            node_names: List[str], status_names: List[str]) -> Dict[str, Any]:
+        """
+        Build the looped node analysis from execution metadata and parsed records.
+        
+        Args:
+            execution_data: Execution data dictionary (only the metadata fields are used)
+            rows: Parsed node execution records from parse_run_data
+            node_names: Node names indexed by the records' node_id
+            status_names: Status names indexed by the records' status code
+            
+        Returns:
+            Dictionary containing looped node analysis
+        """
+        # Extract basic execution info
+        execution_id = execution_data.get('id')
+        workflow_id = execution_data.get('workflowId')
+        workflow_name = execution_data.get('workflowData', {}).get('name', 'Unknown')
+        workflow_data = execution_data.get('workflowData', {})
+        status = execution_data.get('status', 'unknown')
+        started_at = execution_data.get('startedAt')
+        stopped_at = execution_data.get('stoppedAt')
+        created_at = execution_data.get('createdAt')
+        
+        # Parse both timestamps in one call; missing values come back as NaT
+        start_time, end_time = (
+            None if pd.isna(ts) else ts
+            for ts in pd.to_datetime([started_at, stopped_at], utc=True, format='ISO8601')
+        )
+        duration = (end_time - start_time).total_seconds() if start_time and end_time else None
+        
+        status_codes = {name: code for code, name in enumerate(status_names)}
+        
+        # Low-cardinality strings as categoricals built directly from the codes
+        df = pd.DataFrame({
+            'node_name': pd.Categorical.from_codes(rows['node_id'], categories=node_names),
+            'start_time': pd.to_datetime(rows['start_ms'], unit='ms', utc=True),
+            'duration_ms': rows['dur_ms'],
+            'status': pd.Categorical.from_codes(rows['status'], categories=status_names),
+            'execution_index': rows['exec_idx']
+        })
+        # Convert to seconds; executions without a start time have no duration
+        df['duration'] = (df['duration_ms'] / np.float32(1000)).where(df['start_time'].notna())
         
-        # Calculate summary statistics for each node
+        # Calculate summary statistics for each node with integer-code reductions.
+        # Rows are contiguous per node (runData is parsed node by node), so min/max
+        # reduce over each node's slice. Only the scalars are kept; per-node rows
+        # stay in the node_executions frame.
         node_summary_stats = {}
-        for node_name, executions in node_summary.items():
-            durations = [ex['duration'] for ex in executions if ex['duration'] is not None]
-            statuses = [ex['status'] for ex in executions]
+        if len(rows):
+            n_nodes = len(node_names)
+            codes = rows['node_id']
+            durations = np.where(np.isnan(rows['start_ms']), np.nan, rows['dur_ms'].astype(np.float64) / 1000.0)
+            valid = ~np.isnan(durations)
             
-            node_summary_stats[node_name] = {
-                'total_executions': len(executions),
-                'total_time': sum(durations),
-                'average_time': sum(durations) / len(durations) if durations else 0,
-                'min_time': min(durations) if durations else 0,
-                'max_time': max(durations) if durations else 0,
-                'successful_executions': len([s for s in statuses if s == 'success']),
-                'failed_executions': len([s for s in statuses if s == 'error']),
-                'success_rate': len([s for s in statuses if s == 'success']) / len(statuses) * 100 if statuses else 0,
-                'executions': executions
-            }
+            counts = np.bincount(codes, minlength=n_nodes)
+            timed_counts = np.bincount(codes[valid], minlength=n_nodes)
+            totals = np.bincount(codes[valid], weights=durations[valid], minlength=n_nodes)
+            averages = np.divide(totals, timed_counts, out=np.zeros(n_nodes), where=timed_counts > 0)
+            successes = np.bincount(codes, weights=rows['status'] == status_codes.get('success', -1), minlength=n_nodes)
+            failures = np.bincount(codes, weights=rows['status'] == status_codes.get('error', -1), minlength=n_nodes)
+            
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            seen = counts > 0
+            mins = np.zeros(n_nodes)
+            maxs = np.zeros(n_nodes)
+            mins[seen] = np.nan_to_num(np.fmin.reduceat(durations, offsets[seen]))
+            maxs[seen] = np.nan_to_num(np.fmax.reduceat(durations, offsets[seen]))
+            
+            for node_id in np.flatnonzero(counts):
+                count = counts[node_id]
+                node_summary_stats[node_names[node_id]] = {
+                    'total_executions': int(count),
+                    'total_time': float(totals[node_id]),
+                    'average_time': float(averages[node_id]),
+                    'min_time': float(mins[node_id]),
+                    'max_time': float(maxs[node_id]),
+                    'successful_executions': int(successes[node_id]),
+                    'failed_executions': int(failures[node_id]),
+                    'success_rate': float(successes[node_id] / count * 100)
+                }
         
         return {
             'execution_id': execution_id,
@@ -566,13 +801,93 @@ class N8nLoopedNodeAnalyzer:
             'end_time': end_time,
             'duration': duration,
             'created_at': created_at,
-            'has_detailed_data': len(node_executions) > 0,
-            'node_executions': node_executions,
+            'has_detailed_data': len(df) > 0,
+            'node_executions': df,
             'node_summary': node_summary_stats,
             'total_nodes': len(node_summary_stats),
-            'total_node_executions': len(node_executions)
+            'total_node_executions': len(df)
         }
     
+    def save_execution_cache(self, execution_data: Dict[str, Any], rows: np.ndarray,
+                             node_names: List[str], status_names: List[str], cache_dir: str):
+        """
+        Store a parsed execution on disk so later runs can skip the API and parsing.
+        
+        The records go to {execution_id}.npy and the execution metadata to a
+        {execution_id}.json sidecar, together with the instance URL since execution
+        IDs are only unique per n8n instance. Only the fields the analysis reads are
+        kept: node parameters (which may hold credentials) are never written to disk.
+        Executions that have not stopped yet are not cached since their data is still
+        changing.
+        
+        Args:
+            execution_data: Execution data dictionary
+            rows: Parsed node execution records from parse_run_data
+            node_names: Node names indexed by the records' node_id
+            status_names: Status names indexed by the records' status code
+            cache_dir: Directory to write the cache files to
+        """
+        execution_id = execution_data.get('id')
+        if execution_id is None or not execution_data.get('stoppedAt'):
+            return
+        
+        workflow_data = execution_data.get('workflowData', {})
+        meta = {key: execution_data[key] for key in CACHED_EXECUTION_FIELDS if key in execution_data}
+        meta['workflowData'] = {
+            'name': workflow_data.get('name', 'Unknown'),
+            'nodes': [{key: node[key] for key in CACHED_NODE_FIELDS if key in node}
+                      for node in workflow_data.get('nodes', [])],
+            'connections': workflow_data.get('connections', {})
+        }
+        meta['baseUrl'] = self.base_url
+        meta['nodeNames'] = node_names
+        meta['statusNames'] = status_names
+        
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(os.path.join(cache_dir, f"{execution_id}.npy"), rows)
+            with open(os.path.join(cache_dir, f"{execution_id}.json"), 'wb') as f:
+                f.write(orjson.dumps(meta))
+            if self.debug:
+                self.debug_print(f"Cached execution {execution_id} in {cache_dir}")
+        except OSError as e:
+            print(f"Cache Error: {e}")
+    
+    def load_cached_analysis(self, execution_id: int, cache_dir: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the analysis of an execution from the on-disk cache.
+        
+        Args:
+            execution_id: The execution ID to load
+            cache_dir: Directory the cache files were written to
+            
+        Returns:
+            Dictionary containing looped node analysis or None if not cached (or
+            cached from a different n8n instance)
+        """
+        records_path = os.path.join(cache_dir, f"{execution_id}.npy")
+        meta_path = os.path.join(cache_dir, f"{execution_id}.json")
+        if not (os.path.exists(records_path) and os.path.exists(meta_path)):
+            return None
+        
+        try:
+            with open(meta_path, 'rb') as f:
+                meta = orjson.loads(f.read())
+            rows = np.load(records_path, allow_pickle=False)
+        except (OSError, ValueError) as e:
+            print(f"Cache Error: {e}")
+            return None
+        
+        if rows.dtype != NODE_EXECUTION_DTYPE or meta.pop('baseUrl', None) != self.base_url:
+            return None
+        
+        node_names = meta.pop('nodeNames', None)
+        status_names = meta.pop('statusNames', None)
+        if node_names is None or status_names is None:
+            return None
+        
+        return self.summarize_execution(meta, rows, node_names, status_names)
+    
     def create_looped_summary_report(self, analysis_data: Dict[str, Any]):
         """
         Create a summary report for looped node execution.
@@ -584,46 +899,58 @@ class N8nLoopedNodeAnalyzer:
             print("No analysis data available")
             return
         
-        print("\n" + "="*80)
-        print("LOOPED NODE EXECUTION SUMMARY")
-        print("="*80)
-        print(f"Execution ID: {analysis_data['execution_id']}")
-        print(f"Workflow: {analysis_data['workflow_name']}")
-        print(f"Workflow ID: {analysis_data['workflow_id']}")
-        print(f"Status: {analysis_data['status']}")
-        print(f"Start Time: {analysis_data['start_time']}")
-        print(f"End Time: {analysis_data['end_time']}")
-        print(f"Total Duration: {analysis_data['duration']:.2f} seconds" if analysis_data['duration'] else "Duration: N/A")
-        print(f"Total Node Executions: {analysis_data['total_node_executions']}")
-        print(f"Unique Nodes: {analysis_data['total_nodes']}")
-        print("="*80)
-        
-        # Summary by node (summed up)
-        print(f"\n{'Node Name':<30} | {'Executions':<10} | {'Total Time':<12} | {'Avg Time':<10} | {'Min':<8} | {'Max':<8} | {'Success Rate':<12}")
-        print("-" * 80)
+        # Collect the whole report and write it once instead of one print per line
+        lines = [
+            "\n" + "="*80,
+            "LOOPED NODE EXECUTION SUMMARY",
+            "="*80,
+            f"Execution ID: {analysis_data['execution_id']}",
+            f"Workflow: {analysis_data['workflow_name']}",
+            f"Workflow ID: {analysis_data['workflow_id']}",
+            f"Status: {analysis_data['status']}",
+            f"Start Time: {analysis_data['start_time']}",
+            f"End Time: {analysis_data['end_time']}",
+            f"Total Duration: {analysis_data['duration']:.2f} seconds" if analysis_data['duration'] else "Duration: N/A",
+            f"Total Node Executions: {analysis_data['total_node_executions']}",
+            f"Unique Nodes: {analysis_data['total_nodes']}",
+            "="*80,
+            # Summary by node (summed up)
+            f"\n{'Node Name':<30} | {'Executions':<10} | {'Total Time':<12} | {'Avg Time':<10} | {'Min':<8} | {'Max':<8} | {'Success Rate':<12}",
+            "-" * 80
+        ]
         
         node_summary = analysis_data['node_summary']
+        row_format = "{:<30} | {:<10} | {:<12.2f}s | {:<10.2f}s | {:<8.2f}s | {:<8.2f}s | {:<12.1f}%".format
+        lines.extend(
+            row_format(node_name, stats['total_executions'], stats['total_time'], stats['average_time'],
+                       stats['min_time'], stats['max_time'], stats['success_rate'])
+            for node_name, stats in node_summary.items()
+        )
+        lines.append("="*80)
+        
+        # Detailed breakdown for each node; rows are grouped only now that they are needed
+        executions_by_node = dict(iter(analysis_data['node_executions'].groupby('node_name', sort=False, observed=True)))
         for node_name, stats in node_summary.items():
-            print(f"{node_name:<30} | {stats['total_executions']:<10} | {stats['total_time']:<12.2f}s | {stats['average_time']:<10.2f}s | {stats['min_time']:<8.2f}s | {stats['max_time']:<8.2f}s | {stats['success_rate']:<12.1f}%")
-        
-        print("="*80)
-        
-        # Detailed breakdown for each node
-        for node_name, stats in node_summary.items():
-            print(f"\n📊 {node_name}")
-            print("-" * 50)
-            print(f"Total Executions: {stats['total_executions']}")
-            print(f"Total Time (summed): {stats['total_time']:.2f} seconds")
-            print(f"Average Time: {stats['average_time']:.2f} seconds")
-            print(f"Min Time: {stats['min_time']:.2f} seconds")
-            print(f"Max Time: {stats['max_time']:.2f} seconds")
-            print(f"Success Rate: {stats['success_rate']:.1f}%")
-            
-            # Show individual executions
-            print(f"\nIndividual Executions:")
-            for i, exec_data in enumerate(stats['executions']):
-                start_time_str = exec_data['start_time'].strftime('%H:%M:%S.%f')[:-3] if exec_data['start_time'] else "N/A"
-                print(f"  {i+1}. Duration: {exec_data['duration']:.3f}s at {start_time_str} (Status: {exec_data['status']})")
+            lines += [
+                f"\n📊 {node_name}",
+                "-" * 50,
+                f"Total Executions: {stats['total_executions']}",
+                f"Total Time (summed): {stats['total_time']:.2f} seconds",
+                f"Average Time: {stats['average_time']:.2f} seconds",
+                f"Min Time: {stats['min_time']:.2f} seconds",
+                f"Max Time: {stats['max_time']:.2f} seconds",
+                f"Success Rate: {stats['success_rate']:.1f}%",
+                # Show individual executions (formatted column-wise)
+                f"\nIndividual Executions:"
+            ]
+            executions = executions_by_node[node_name]
+            if len(executions):
+                numbers = pd.Series(np.arange(1, len(executions) + 1), index=executions.index).astype(str)
+                durations = executions['duration'].map('{:.3f}s'.format, na_action='ignore').fillna("N/A")
+                start_times = executions['start_time'].dt.strftime('%H:%M:%S.%f').str[:-3].fillna("N/A")
+                lines.extend("  " + numbers + ". Duration: " + durations + " at " + start_times + " (Status: " + executions['status'].astype(str) + ")")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def create_interactive_visualization(self, analysis_data: Dict[str, Any], export_png: bool = False, png_width: int = 1920, png_height: int = 1080):
         """
@@ -671,14 +998,21 @@ class N8nLoopedNodeAnalyzer:
 def main():
     """Main function to run the analyzer."""
     parser = argparse.ArgumentParser(description='Analyze n8n looped node execution with interactive navigation')
-    parser.add_argument('--execution-id', type=int, required=True, help='Execution ID to analyze')
+    parser.add_argument('--execution-id', type=int, nargs='+', required=True, help='Execution ID(s) to analyze; multiple IDs are fetched concurrently')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode to see raw API responses')
     parser.add_argument('--export-png', action='store_true', help='Export plots as PNG files instead of showing interactive viewer')
     parser.add_argument('--png-width', type=int, default=1920, help='PNG width in pixels (default: 1920)')
     parser.add_argument('--png-height', type=int, default=1080, help='PNG height in pixels (default: 1080)')
+    parser.add_argument('--cache-dir', default='./cache', help='Directory for cached parsed executions (default: ./cache)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached executions and fetch them from the API again')
+    parser.add_argument('--stream-json', action='store_true', help='Stream-parse responses with ijson to save memory on huge executions')
     
     args = parser.parse_args()
     
+    # PNG export never opens a window, so skip GUI backend startup and render with Agg
+    if args.export_png:
+        matplotlib.use('Agg')
+    
     # Get configuration from environment
     base_url = os.getenv('N8N_BASE_URL')
     api_key = os.getenv('N8N_API_KEY')
@@ -693,26 +1027,44 @@ def main():
     print(f"Base URL: {base_url}")
     print(f"✅ API Authentication: Working!")
     print(f"✅ Detailed Data: Enabled (includeData=true)")
-    print(f"Analyzing Execution ID: {args.execution_id}")
+    print(f"Analyzing Execution ID(s): {', '.join(map(str, args.execution_id))}")
     print("="*60)
     
     # Initialize analyzer
-    analyzer = N8nLoopedNodeAnalyzer(base_url, api_key, debug=args.debug)
+    if args.stream_json and ijson is None:
+        print("Warning: --stream-json needs the ijson package; parsing responses in full instead")
+    analyzer = N8nLoopedNodeAnalyzer(base_url, api_key, debug=args.debug, stream_json=args.stream_json)
+    
+    # Use cached executions where possible
+    cached = {}
+    if not args.refresh:
+        for execution_id in args.execution_id:
+            cached[execution_id] = analyzer.load_cached_analysis(execution_id, args.cache_dir)
     
-    # Analyze specific execution
-    print(f"Fetching execution data for ID: {args.execution_id}")
-    execution_data = analyzer.fetch_execution_data(args.execution_id)
+    # Fetch the remaining executions concurrently
+    to_fetch = list(dict.fromkeys(execution_id for execution_id in args.execution_id if cached.get(execution_id) is None))
+    fetched = {}
+    if to_fetch:
+        print(f"Fetching execution data for ID(s): {', '.join(map(str, to_fetch))}")
+        fetched = analyzer.fetch_many_executions(to_fetch)
     
-    if execution_data:
-        print("✅ Execution data fetched successfully!")
-        analysis = analyzer.analyze_looped_execution(execution_data)
+    # Analyze them in the requested order
+    for execution_id in dict.fromkeys(args.execution_id):
+        analysis = cached.get(execution_id)
+        if analysis:
+            print(f"✅ Execution data for ID {execution_id} loaded from cache ({args.cache_dir})")
+        elif fetched.get(execution_id):
+            print(f"✅ Execution data for ID {execution_id} fetched successfully!")
+            analysis = analyzer.analyze_looped_execution(fetched[execution_id], cache_dir=args.cache_dir)
+        else:
+            print(f"❌ Failed to fetch execution data for ID {execution_id}")
+            continue
+        
         analyzer.create_looped_summary_report(analysis)
         analyzer.create_interactive_visualization(analysis, 
                                                 export_png=args.export_png, 
                                                 png_width=args.png_width, 
                                                 png_height=args.png_height)
-    else:
-        print("❌ Failed to fetch execution data")
 
 if __name__ == "__main__":
     main()